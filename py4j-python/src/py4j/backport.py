@@ -231,3 +231,109 @@ if version_info[:2] == (2, 6):
 
         def isdisjoint(self, other):
             return len(self.intersection(other)) == 0
+
+    _MARKER = object()
+
+    class OrderedDict(dict):
+        # Dictionary that remembers insertion order. Keys are kept in a
+        # doubly linked list of [PREV, NEXT, KEY] links so that insertion and
+        # deletion remain O(1).
+
+        def __init__(self, *args, **kwds):
+            self.__root = root = []
+            root[:] = [root, root, None]
+            self.__map = {}
+            self.update(*args, **kwds)
+
+        def __setitem__(self, key, value):
+            if key not in self:
+                root = self.__root
+                last = root[0]
+                last[1] = root[0] = self.__map[key] = [last, root, key]
+            dict.__setitem__(self, key, value)
+
+        def __delitem__(self, key):
+            dict.__delitem__(self, key)
+            link_prev, link_next, _ = self.__map.pop(key)
+            link_prev[1] = link_next
+            link_next[0] = link_prev
+
+        def __iter__(self):
+            root = self.__root
+            curr = root[1]
+            while curr is not root:
+                yield curr[2]
+                curr = curr[1]
+
+        def __reversed__(self):
+            root = self.__root
+            curr = root[0]
+            while curr is not root:
+                yield curr[2]
+                curr = curr[0]
+
+        def __repr__(self):
+            return "%s(%r)" % (self.__class__.__name__, self.items())
+
+        def clear(self):
+            root = self.__root
+            root[:] = [root, root, None]
+            self.__map.clear()
+            dict.clear(self)
+
+        def update(self, *args, **kwds):
+            if args:
+                other = args[0]
+                if hasattr(other, "keys"):
+                    for key in other.keys():
+                        self[key] = other[key]
+                else:
+                    for key, value in other:
+                        self[key] = value
+            for key, value in kwds.items():
+                self[key] = value
+
+        def keys(self):
+            return list(self)
+
+        def values(self):
+            return [self[key] for key in self]
+
+        def items(self):
+            return [(key, self[key]) for key in self]
+
+        def iterkeys(self):
+            return iter(self)
+
+        def itervalues(self):
+            for key in self:
+                yield self[key]
+
+        def iteritems(self):
+            for key in self:
+                yield (key, self[key])
+
+        def pop(self, key, default=_MARKER):
+            if key in self:
+                result = self[key]
+                del self[key]
+                return result
+            if default is _MARKER:
+                raise KeyError(key)
+            return default
+
+        def setdefault(self, key, default=None):
+            if key in self:
+                return self[key]
+            self[key] = default
+            return default
+
+        def popitem(self, last=True):
+            if not self:
+                raise KeyError("dictionary is empty")
+            key = next(reversed(self) if last else iter(self))
+            value = self.pop(key)
+            return key, value
+
+        def copy(self):
+            return self.__class__(self)
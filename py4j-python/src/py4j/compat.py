@@ -14,8 +14,10 @@ version_info = sys.version_info
 
 if version_info[:2] == (2, 6):
     from py4j.backport import WeakSet  # noqa
+    from py4j.backport import OrderedDict  # noqa
 else:
     from weakref import WeakSet  # noqa
+    from collections import OrderedDict  # noqa
 
 if version_info[0] < 3:
     def items(d):
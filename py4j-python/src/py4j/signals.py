@@ -4,14 +4,17 @@
 The signals pattern is very similar to the listener/observer pattern.
 
 """
-from inspect import ismethod
 from threading import Lock
+from types import MethodType
 
-from py4j.compat import range
+from py4j.compat import OrderedDict, iteritems
 
 
 def make_id(func):
-    if ismethod(func):
+    # Exact type check: cheaper than inspect.ismethod and MethodType cannot be
+    # subclassed. Probing __self__ would also match builtin methods, which
+    # have no __func__.
+    if type(func) is MethodType:
         return (id(func.__self__), id(func.__func__))
     return id(func)
 
@@ -30,10 +33,17 @@ class Signal(object):
     """
 
     def __init__(self):
+        # A plain Lock is enough: the lock only guards the receivers and is
+        # never held while a receiver is called, so it is never reentered.
         self.lock = Lock()
-        # Someday, we may implement caching, but in practice, we expect the
-        # number of receivers to be very small.
-        self.receivers = []
+        # Receivers are indexed by their full id so that connect and
+        # disconnect do not need to scan all receivers. The order of
+        # insertion is preserved to send the signal in the connection order.
+        self.receivers = OrderedDict()
+        # Immutable copy of the receivers, as (sender_id, receiver) pairs,
+        # that is rebuilt whenever the receivers change. send reads it without
+        # acquiring the lock: rebinding an attribute is atomic.
+        self._snapshot = ()
 
     def connect(self, receiver, sender=None, unique_id=None):
         """Registers a receiver for this signal.
@@ -54,11 +64,9 @@ class Signal(object):
         full_id = self._get_id(receiver, unique_id, sender)
 
         with self.lock:
-            for receiver_id, _ in self.receivers:
-                if receiver_id == full_id:
-                    break
-            else:
-                self.receivers.append((full_id, receiver))
+            if full_id not in self.receivers:
+                self.receivers[full_id] = receiver
+                self._update_snapshot()
 
     def disconnect(self, receiver, sender=None, unique_id=None):
         """Unregisters a receiver for this signal.
@@ -72,15 +80,11 @@ class Signal(object):
         :rtype: bool
         """
         full_id = self._get_id(receiver, unique_id, sender)
-        disconnected = False
 
         with self.lock:
-            for index in range(len(self.receivers)):
-                temp_id = self.receivers[index][0]
-                if temp_id == full_id:
-                    del self.receivers[index]
-                    disconnected = True
-                    break
+            disconnected = self.receivers.pop(full_id, None) is not None
+            if disconnected:
+                self._update_snapshot()
 
         return disconnected
 
@@ -91,28 +95,138 @@ class Signal(object):
         interrupts the sending processing. It is thus possible that not all
         receivers will receive the signal.
 
-        :param: named parameters to send to the receivers.
+        :param: named parameters to send to the receivers. ``signal`` is
+            reserved and raises a TypeError.
         :param: the sender of the signal. Optional.
         :return: List of (receiver, response) from receivers.
         :rtype: list
         """
+        self._add_params(sender, params)
+        snapshot = self._snapshot
+        if not snapshot:
+            return []
+
+        # The sender filter of _get_receivers is inlined in send, the hot
+        # path, to avoid building an intermediate tuple of receivers. Keep
+        # both filters in sync.
+        sender_id = make_id(sender)
+        if len(snapshot) == 1:
+            # Most signals have a single receiver: skip the loop machinery.
+            rsender_id, receiver = snapshot[0]
+            if rsender_id == NONE_ID or rsender_id == sender_id:
+                return [(receiver, receiver(**params))]
+            return []
+
+        responses = []
+        append = responses.append
+        for rsender_id, receiver in snapshot:
+            if rsender_id == NONE_ID or rsender_id == sender_id:
+                append((receiver, receiver(**params)))
+        return responses
+
+    def send_responses_only(self, sender, **params):
+        """Sends the signal to all connected receivers and only returns their
+        responses.
+
+        Behaves like :meth:`send`, but does not pair each response with its
+        receiver, which is cheaper when the receivers are not needed.
+
+        :param: named parameters to send to the receivers. ``signal`` is
+            reserved and raises a TypeError.
+        :param: the sender of the signal. Optional.
+        :return: List of responses from receivers, in the order the receivers
+            were connected.
+        :rtype: list
+        """
+        self._add_params(sender, params)
+        if not self._snapshot:
+            return []
+
+        return [receiver(**params) for receiver in self._get_receivers(sender)]
+
+    def send_robust(self, sender, **params):
+        """Sends the signal to all connected receivers, catching errors.
+
+        As opposed to :meth:`send`, if a receiver raises an error, the error
+        is returned as the receiver's response and the signal is still sent
+        to the remaining receivers.
+
+        :param: named parameters to send to the receivers. ``signal`` is
+            reserved and raises a TypeError.
+        :param: the sender of the signal. Optional.
+        :return: List of (receiver, response) from receivers. The response is
+            the exception instance if the receiver raised an error.
+        :rtype: list
+        """
+        self._add_params(sender, params)
+        if not self._snapshot:
+            return []
+
         responses = []
         for receiver in self._get_receivers(sender):
-            response = receiver(signal=self, sender=sender, **params)
+            try:
+                response = receiver(**params)
+            except Exception as e:
+                response = e
             responses.append((receiver, response))
         return responses
 
+    def bind(self, sender, **params):
+        """Returns a callable that sends the signal to the receivers with the
+        same sender and named parameters every time it is called.
+
+        This is useful to send the same signal repeatedly: the receivers and
+        their arguments are resolved once, when bind is called. Receivers
+        connected or disconnected afterward are not affected by the returned
+        callable.
+
+        :param: named parameters to send to the receivers. ``signal`` is
+            reserved and raises a TypeError.
+        :param: the sender of the signal. Optional.
+        :return: A callable without argument that returns a list of
+            (receiver, response) from receivers.
+        """
+        self._add_params(sender, params)
+        receivers = self._get_receivers(sender)
+
+        def send_bound():
+            return [(receiver, receiver(**params)) for receiver in receivers]
+
+        return send_bound
+
+    def _add_params(self, sender, params):
+        """Internal method that adds the signal and the sender to the named
+        parameters sent to the receivers.
+
+        params is the new dict created for the call, so the arguments shared
+        by all receivers are added to it once instead of once per receiver.
+
+        :raise TypeError: if params already contains a ``signal`` parameter,
+            which would otherwise be silently replaced.
+        """
+        if "signal" in params:
+            raise TypeError(
+                "got multiple values for keyword argument 'signal'")
+        params["signal"] = self
+        params["sender"] = sender
+
     def _get_receivers(self, sender):
-        """Internal method that may in the future resolve weak references or
-        perform other work such as identifying dead receivers.
+        """Internal method that returns the receivers of the current snapshot
+        that must receive signals sent by sender.
         """
         sender_id = make_id(sender)
-        receivers = []
-        with self.lock:
-            for ((_, rsender_id), receiver) in self.receivers:
-                if rsender_id == NONE_ID or rsender_id == sender_id:
-                    receivers.append(receiver)
-        return receivers
+        return tuple(
+            receiver for rsender_id, receiver in self._snapshot
+            if rsender_id == NONE_ID or rsender_id == sender_id)
+
+    def _update_snapshot(self):
+        """Internal method that rebuilds the receivers snapshot read by send.
+
+        Must be called while holding the lock.
+        """
+        self._snapshot = tuple(
+            (rsender_id, receiver) for ((_, rsender_id), receiver)
+            in iteritems(self.receivers))
 
     def _get_id(self, receiver, unique_id, sender):
         sender_id = make_id(sender)
@@ -95,3 +95,116 @@ class SignalTest(TestCase):
             self.assertTrue(True)
         self.assertEqual(1, self.called[0])
         self.assertEqual(1, len(self.called_kwargs))
+
+    def testSendOrder(self):
+        receivers = []
+        for index in range(10):
+            def receiver(signal, sender, **kwargs):
+                pass
+            receivers.append(receiver)
+            self.alert.connect(receiver)
+
+        responses = self.alert.send(SignalTest)
+        self.assertEqual(receivers, [r for (r, _) in responses])
+
+    def testConnectFromReceiver(self):
+        alert = self.alert
+        receiver1 = self.receiver1
+
+        def self_removing_receiver(signal, sender, **kwargs):
+            signal.disconnect(self_removing_receiver)
+            signal.connect(receiver1)
+
+        alert.connect(self_removing_receiver)
+        alert.send(SignalTest)
+        self.assertEqual(0, self.called[0])
+        self.assertEqual([receiver1], list(alert.receivers.values()))
+
+        alert.send(SignalTest)
+        self.assertEqual(1, self.called[0])
+
+    def testSendSingleReceiver(self):
+        self.assertEqual([], self.alert.send(SignalTest))
+
+        self.alert.connect(self.receiver1, sender=self.instance2)
+        self.assertEqual([], self.alert.send(self.instance1, param1="foo"))
+        self.assertEqual(0, self.called[0])
+
+        self.assertEqual(
+            [(self.receiver1, None)],
+            self.alert.send(self.instance2, param1="foo"))
+        self.assertEqual([{"param1": "foo"}], self.called_kwargs)
+
+    def testConnectBuiltinMethod(self):
+        received = {}
+        # Builtin methods are not MethodType: keep a reference to disconnect.
+        update = received.update
+        self.alert.connect(update)
+        self.alert.connect(self.receiver2.receiver2_method)
+        self.alert.send(SignalTest, param1="foo")
+        self.assertEqual("foo", received["param1"])
+        self.assertEqual(1, self.called[0])
+
+        self.assertTrue(self.alert.disconnect(update))
+        self.assertTrue(self.alert.disconnect(self.receiver2.receiver2_method))
+        self.assertEqual(0, len(self.alert.receivers))
+
+    def testBind(self):
+        self.testConnect()
+        send_bound = self.alert.bind(self.instance2, param1="foo")
+
+        # Receivers connected after bind do not receive the signal.
+        self.alert.connect(self.error_receiver3)
+
+        for _ in range(2):
+            responses = send_bound()
+            self.assertEqual(4, len(responses))
+        self.assertEqual(8, self.called[0])
+        self.assertEqual([{"param1": "foo"}] * 8, self.called_kwargs)
+
+        # The receiver connected to instance2 is skipped.
+        self.alert.disconnect(self.error_receiver3)
+        responses = self.alert.bind(SignalTest, param1="foo")()
+        self.assertEqual(3, len(responses))
+        self.assertEqual(11, self.called[0])
+
+    def testSendRobust(self):
+        self.alert.connect(self.receiver1)
+        self.alert.connect(self.error_receiver3)
+        self.alert.connect(self.receiver2.receiver2_method)
+        self.alert.connect(self.receiver1, sender=self.instance2,
+                           unique_id="bar")
+
+        # The receiver connected to instance2 is skipped.
+        responses = self.alert.send_robust(SignalTest, param1="foo")
+        self.assertEqual(3, len(responses))
+        self.assertEqual(self.error_receiver3, responses[1][0])
+        self.assertTrue(isinstance(responses[1][1], Exception))
+        self.assertEqual(2, self.called[0])
+        self.assertEqual([{"param1": "foo"}] * 2, self.called_kwargs)
+
+    def testSendResponsesOnly(self):
+        self.assertEqual([], self.alert.send_responses_only(SignalTest))
+
+        self.testConnect()
+        responses = self.alert.send_responses_only(
+            self.instance2, param1="foo", param2=3)
+        self.assertEqual([None] * 4, responses)
+        self.assertEqual([{"param1": "foo", "param2": 3}] * 4,
+                         self.called_kwargs)
+
+        # The receiver connected to instance2 is skipped.
+        responses = self.alert.send_responses_only(SignalTest, param1="foo")
+        self.assertEqual([None] * 3, responses)
+        self.assertEqual(7, self.called[0])
+
+    def testSendSignalParam(self):
+        for send in (self.alert.send, self.alert.send_robust,
+                     self.alert.send_responses_only, self.alert.bind):
+            self.assertRaises(TypeError, send, SignalTest, signal="foo")
+
+        self.testConnect()
+        for send in (self.alert.send, self.alert.send_robust,
+                     self.alert.send_responses_only, self.alert.bind):
+            self.assertRaises(TypeError, send, SignalTest, signal="foo")
+        self.assertEqual(0, self.called[0])